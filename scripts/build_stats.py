@@ -3,7 +3,7 @@
 Utility for transforming raw Profixio EMP feeds into site-ready JSON.
 
 Usage:
-    python scripts/build_stats.py
+    python scripts/build_stats.py [--pretty-raw] [--incremental]
 
 The script discovers seasons from data/sources_XX-YY.txt and
 data/schedule_XX-YY.csv files.  Each season's output lands in
@@ -11,15 +11,25 @@ docs/data/<season>/ and a manifest is written to docs/data/seasons.json.
 """
 from __future__ import annotations
 
+import argparse
 import csv
+import hashlib
 import json
-import re
+import os
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
 from zoneinfo import ZoneInfo
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 # Default team id for Kungsholmen OG in Profixio (25-26 onward)
 KOG_TEAM_ID = 1403069
 
@@ -29,8 +39,15 @@ PROCESSED_DIR = ROOT / "data" / "processed"
 SITE_DATA_DIR = ROOT / "docs" / "data"
 LINKS_PATH = ROOT / "data" / "links.txt"
 
+# Fingerprint of this script; per-game outputs built by a different version
+# are never reused by --incremental.
+BUILD_SHA256 = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
 SCHEDULE_TZ = ZoneInfo("Europe/Stockholm")
 
+# Sort sentinel that places games without a tipoff last.
+FAR_FUTURE = datetime.max.replace(tzinfo=timezone.utc)
+
 # Season month where a new campaign starts (September).
 SEASON_START_MONTH = 9
 
@@ -42,7 +59,66 @@ SEASONS: list[dict] = [
     {"key": "23-24", "startYear": 2023, "label": "2023-24", "teamId": 1114613},
 ]
 
-EMP_PATTERN = re.compile(r"/emp/(\d+)/")
+# Column layout of the flat per-game stats array in build_team_structures.
+STAT_KEYS = ("points", "onePointMade", "twoPointMade", "threePointMade", "fouls")
+STAT_POINTS, STAT_ONE, STAT_TWO, STAT_THREE, STAT_FOULS = range(len(STAT_KEYS))
+
+# Scoring lookup tables indexed by eventTypeId: the stats column a made shot
+# counts towards and its point value.  A value of 0 means "not a scoring event".
+EVENT_TYPE_LIMIT = 200
+POINT_COLUMN = [0] * EVENT_TYPE_LIMIT
+POINT_VALUE = [0] * EVENT_TYPE_LIMIT
+POINT_COLUMN[106], POINT_VALUE[106] = STAT_ONE, 1  # free throw
+POINT_COLUMN[104], POINT_VALUE[104] = STAT_TWO, 2  # two pointer
+POINT_COLUMN[103], POINT_VALUE[103] = STAT_THREE, 3  # three pointer
+
+
+# ── JSON helpers ────────────────────────────────────────────────────────────
+
+def _json_default(value: object) -> object:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def load_json(data: bytes) -> object:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(payload: object) -> bytes:
+    """Serialize ``payload`` as 2-space indented UTF-8 JSON.
+
+    The stdlib fallback is configured to produce the same bytes as orjson so
+    that published files do not churn depending on which one is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, indent=2, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def write_json(path: Path, payload: object) -> bool:
+    """Atomically write ``payload`` to ``path`` unless the file already holds it.
+
+    Returns True when the file was (re)written.
+    """
+    data = dump_json(payload)
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    finally:
+        # Only left behind if the write or rename failed.
+        tmp_path.unlink(missing_ok=True)
+    return True
 
 
 # ── Season discovery ────────────────────────────────────────────────────────
@@ -76,18 +152,33 @@ def game_ids_for_season(season_cfg: dict) -> set[int]:
             cleaned = line.strip()
             if not cleaned or cleaned.startswith("#"):
                 continue
-            match = EMP_PATTERN.search(cleaned)
-            if match:
-                ids.add(int(match.group(1)))
+            match_id = emp_match_id(cleaned)
+            if match_id is not None:
+                ids.add(match_id)
     return ids
 
 
+def emp_match_id(url: str) -> int | None:
+    """Return the match id from a Profixio ``.../emp/<id>/...`` URL, or None.
+
+    Like a ``/emp/(\\d+)/`` regex search, the first ``/emp/`` followed by
+    digits and a slash wins, even if an earlier ``/emp/`` is not.
+    """
+    marker = "/emp/"
+    start = url.find(marker)
+    while start != -1:
+        digits, slash, _ = url[start + len(marker):].partition("/")
+        if slash and digits.isdecimal():
+            return int(digits)
+        start = url.find(marker, start + 1)
+    return None
+
+
 # ── Player totals ───────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class PlayerTotals:
     name: str
-    numbers: set[str] = field(default_factory=set)
     last_number: str = ""
     last_number_seen_ts: float = -1.0
     games_played: int = 0
@@ -95,6 +186,14 @@ class PlayerTotals:
     two_pointers: int = 0
     three_pointers: int = 0
     fouls: int = 0
+    total_points: int = field(default=0, init=False)
+    sort_name: str = field(init=False, repr=False)
+    # Shortest, then lexicographically smallest, number seen; as_row falls
+    # back to it when last_number is unset.
+    best_number: str = field(default="", init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.sort_name = self.name.lower()
 
     def register_game(
         self,
@@ -108,7 +207,9 @@ class PlayerTotals:
     ) -> None:
         number = (number or "").strip()
         if number:
-            self.numbers.add(number)
+            best = self.best_number
+            if not best or (len(number), number) < (len(best), best):
+                self.best_number = number
             ts = tipoff_ts if tipoff_ts is not None else -1.0
             if ts >= self.last_number_seen_ts:
                 self.last_number_seen_ts = ts
@@ -121,16 +222,10 @@ class PlayerTotals:
         self.two_pointers += two_pointers
         self.three_pointers += three_pointers
         self.fouls += fouls
-
-    @property
-    def total_points(self) -> int:
-        return self.free_throws + self.two_pointers * 2 + self.three_pointers * 3
+        self.total_points += free_throws + two_pointers * 2 + three_pointers * 3
 
     def as_row(self) -> Dict[str, object]:
-        if self.last_number:
-            number = self.last_number
-        else:
-            number = sorted(self.numbers, key=lambda n: (len(n), n))[0] if self.numbers else ""
+        number = self.last_number or self.best_number
         ppg = round(self.total_points / self.games_played, 1) if self.games_played else 0
 
         return {
@@ -148,19 +243,36 @@ class PlayerTotals:
 
 # ── Raw game loading ────────────────────────────────────────────────────────
 
-def load_raw_games(allowed_ids: set[int] | None = None) -> Iterable[Tuple[int, dict]]:
-    pattern = re.compile(r"game_(\d+)\.json$")
+def raw_game_files(allowed_ids: set[int] | None = None) -> Iterable[Tuple[int, Path]]:
+    """Yield ``(game_id, path)`` for cached raw feeds, sorted by file name."""
     for raw_file in sorted(RAW_DIR.glob("game_*.json")):
-        match = pattern.search(raw_file.name)
-        if not match:
+        digits = raw_file.stem[len("game_"):]
+        if not digits.isdecimal():
             continue
 
-        game_id = int(match.group(1))
+        game_id = int(digits)
         if allowed_ids is not None and game_id not in allowed_ids:
             continue
 
-        with raw_file.open("r", encoding="utf-8") as handle:
-            yield game_id, json.load(handle)
+        yield game_id, raw_file
+
+
+def build_key_for(raw_data: bytes) -> dict:
+    """Identify the inputs of a game summary: the raw feed and this script."""
+    return {"rawSha256": hashlib.sha256(raw_data).hexdigest(), "buildSha256": BUILD_SHA256}
+
+
+def load_existing_json(path: Path) -> object | None:
+    """Return the parsed contents of a previously written output, or None."""
+    try:
+        return load_json(path.read_bytes())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def summary_teams(summary: dict) -> Dict[int, dict]:
+    """Rebuild the ``build_team_structures`` result from a written game summary."""
+    return {team["teamId"]: team for team in summary.get("teamStats", [])}
 
 
 # ── Schedule parsing ────────────────────────────────────────────────────────
@@ -169,7 +281,12 @@ def parse_schedule_datetime(raw_value: str, start_year: int) -> datetime | None:
     raw_value = " ".join((raw_value or "").strip().split())
     if not raw_value:
         return None
+    return _parse_schedule_datetime_cached(raw_value, start_year)
+
 
+@lru_cache(maxsize=1024)
+def _parse_schedule_datetime_cached(raw_value: str, start_year: int) -> datetime | None:
+    # strptime is slow and date labels repeat across rows and seasons.
     try:
         parsed = datetime.strptime(raw_value, "%a %d.%b %H:%M")
     except ValueError:
@@ -194,6 +311,14 @@ def to_int(value: str | None) -> int | None:
         return None
 
 
+def match_result(point_diff: int) -> str:
+    if point_diff > 0:
+        return "win"
+    if point_diff < 0:
+        return "loss"
+    return "draw"
+
+
 def load_schedule(schedule_path: Path, start_year: int) -> Dict[int, dict]:
     if not schedule_path.exists():
         return {}
@@ -242,12 +367,7 @@ def load_schedule(schedule_path: Path, start_year: int) -> Dict[int, dict]:
                     entry["kogScore"] = away_score
                     entry["opponentScore"] = home_score
                 entry["pointDiff"] = entry["kogScore"] - entry["opponentScore"]
-                if entry["pointDiff"] > 0:
-                    entry["result"] = "win"
-                elif entry["pointDiff"] < 0:
-                    entry["result"] = "loss"
-                else:
-                    entry["result"] = "draw"
+                entry["result"] = match_result(entry["pointDiff"])
 
             schedule[match_id] = entry
 
@@ -437,7 +557,12 @@ def build_play_by_play(
     return timeline
 
 
-def publish_play_by_play(game_id: int, game: dict, schedule_entry: dict, opponent_team_id: int | None, play_by_play_dir: Path, kog_team_id: int = KOG_TEAM_ID) -> None:
+# Schedule fields copied into (and, via homeOrAway/opponent, used to build)
+# each play-by-play file.
+PLAY_BY_PLAY_SCHEDULE_KEYS = ("opponent", "homeOrAway", "location", "dateLabel")
+
+
+def publish_play_by_play(game_id: int, game: dict, schedule_entry: dict, opponent_team_id: int | None, target: Path, kog_team_id: int = KOG_TEAM_ID) -> None:
     events = game.get("events")
     if not events:
         return
@@ -446,17 +571,24 @@ def publish_play_by_play(game_id: int, game: dict, schedule_entry: dict, opponen
     if not timeline:
         return
 
-    play_by_play_dir.mkdir(parents=True, exist_ok=True)
     payload = {
         "matchId": game_id,
-        "opponent": schedule_entry.get("opponent"),
-        "homeOrAway": schedule_entry.get("homeOrAway"),
-        "location": schedule_entry.get("location"),
-        "dateLabel": schedule_entry.get("dateLabel"),
+        **{key: schedule_entry.get(key) for key in PLAY_BY_PLAY_SCHEDULE_KEYS},
         "timeline": timeline,
     }
-    target = play_by_play_dir / f"game_{game_id}.json"
-    target.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    write_json(target, payload)
+
+
+def play_by_play_is_current(target: Path, game_id: int, schedule_entry: dict) -> bool:
+    """Return True if ``target`` was published for this game and schedule entry.
+
+    Only meaningful when the game's feed and build script are unchanged; the
+    timeline is otherwise fully determined by the schedule fields it echoes.
+    """
+    existing = load_existing_json(target)
+    if not isinstance(existing, dict) or existing.get("matchId") != game_id:
+        return False
+    return all(existing.get(key) == schedule_entry.get(key) for key in PLAY_BY_PLAY_SCHEDULE_KEYS)
 
 
 # ── Metrics helpers ─────────────────────────────────────────────────────────
@@ -478,12 +610,7 @@ def apply_metrics_to_schedule(schedule: Dict[int, dict], metrics: Dict[str, obje
     entry["kogScore"] = int(kog_points)
     entry["opponentScore"] = int(opponent_points)
     entry["pointDiff"] = entry["kogScore"] - entry["opponentScore"]
-    if entry["pointDiff"] > 0:
-        entry["result"] = "win"
-    elif entry["pointDiff"] < 0:
-        entry["result"] = "loss"
-    else:
-        entry["result"] = "draw"
+    entry["result"] = match_result(entry["pointDiff"])
     entry["status"] = "played"
     entry["hasStats"] = True
 
@@ -503,27 +630,17 @@ def apply_metrics_to_schedule(schedule: Dict[int, dict], metrics: Dict[str, obje
 
 
 def publish_schedule(schedule: Dict[int, dict], site_dir: Path) -> None:
-    site_dir.mkdir(parents=True, exist_ok=True)
-
     def sort_key(item: dict) -> datetime:
         tipoff = item.get("tipoff")
         if isinstance(tipoff, datetime):
             return tipoff
-        return datetime.max.replace(tzinfo=timezone.utc)
+        return FAR_FUTURE
 
-    games = sorted(schedule.values(), key=sort_key)
-    payload = []
-    for game in games:
-        serialized = dict(game)
-        tipoff = serialized.get("tipoff")
-        if isinstance(tipoff, datetime):
-            serialized["tipoff"] = tipoff.isoformat()
-        else:
-            serialized["tipoff"] = None if not tipoff else str(tipoff)
-        payload.append(serialized)
+    # Tipoffs stay timezone-aware datetimes; dump_json emits them as ISO 8601.
+    payload = sorted(schedule.values(), key=sort_key)
 
     schedule_path = site_dir / "kog_schedule.json"
-    schedule_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    write_json(schedule_path, payload)
 
 
 def load_links() -> list[dict]:
@@ -545,13 +662,52 @@ def load_links() -> list[dict]:
 
 
 def publish_links(links: list[dict]) -> None:
-    SITE_DATA_DIR.mkdir(parents=True, exist_ok=True)
     links_path = SITE_DATA_DIR / "kog_links.json"
-    links_path.write_text(json.dumps(links, indent=2), encoding="utf-8")
+    write_json(links_path, links)
+
+
+def _accumulate_events(events: list[dict], teams: Dict[int, dict], stats: array) -> None:
+    """Add scoring and foul events into the flat ``stats`` array.
+
+    Each team's ``_index`` maps player id -> row; a row spans ``len(STAT_KEYS)``
+    columns.  Scoring events are resolved through POINT_COLUMN/POINT_VALUE.
+    Also fills in ``teamName`` from the first event that carries one.
+    """
+    width = len(STAT_KEYS)
+    for event in events:
+        team = teams.get(event.get("teamId"))
+        if not team:
+            continue
+
+        if not team["teamName"]:
+            team_name = (event.get("teamName") or "").strip()
+            if team_name:
+                team["teamName"] = team_name
+
+        person = event.get("person") or {}
+        row = team["_index"].get(person.get("id"))
+        if row is None:
+            continue
+
+        base = row * width
+        event_type = event.get("eventTypeId")
+        if event_type == 109:  # personal foul
+            stats[base + STAT_FOULS] += 1
+            continue
+        if not isinstance(event_type, int) or not 0 <= event_type < EVENT_TYPE_LIMIT:
+            continue
+
+        value = POINT_VALUE[event_type]
+        if value:
+            made = int((event.get("goals") or 0) // value)
+            if made:
+                stats[base + POINT_COLUMN[event_type]] += made
+                stats[base + STAT_POINTS] += value * made
 
 
 def build_team_structures(game: dict) -> Dict[int, dict]:
     teams: Dict[int, dict] = {}
+    roster_entries: list[dict] = []
 
     for member in game.get("lineup", []):
         team_id = member.get("webTeamId")
@@ -576,71 +732,48 @@ def build_team_structures(game: dict) -> Dict[int, dict]:
             "type": member.get("type"),
             "starter": member.get("starter", False),
             "played": member.get("played", False),
-            "stats": {
-                "points": 0,
-                "onePointMade": 0,
-                "twoPointMade": 0,
-                "threePointMade": 0,
-                "fouls": 0,
-            },
         }
 
-        team["_index"][player_entry["playerId"]] = player_entry
+        # The index maps player id -> row in the flat stats array below.
+        team["_index"][player_entry["playerId"]] = len(roster_entries)
+        roster_entries.append(player_entry)
         team["roster"].append(player_entry)
 
-    points_events = {
-        106: ("onePointMade", 1),
-        104: ("twoPointMade", 2),
-        103: ("threePointMade", 3),
-    }
+    width = len(STAT_KEYS)
+    stats = array("i", [0]) * (width * len(roster_entries))
+    _accumulate_events(game.get("events", []), teams, stats)
 
-    for event in game.get("events", []):
-        team_id = event.get("teamId")
-        person = event.get("person") or {}
-        player_id = person.get("id")
-
-        team = teams.get(team_id)
-        if team:
-            if not team["teamName"]:
-                team_name = (event.get("teamName") or "").strip()
-                if team_name:
-                    team["teamName"] = team_name
-
-            player_entry = team["_index"].get(player_id)
-            if player_entry:
-                event_type = event.get("eventTypeId")
-                if event_type in points_events and event.get("goals"):
-                    key, value = points_events[event_type]
-                    raw_goals = event.get("goals", 0) or 0
-                    made = int(raw_goals // value) if value else int(raw_goals)
-                    if made:
-                        player_entry["stats"][key] += made
-                        player_entry["stats"]["points"] += value * made
-
-                if event_type == 109:  # personal foul
-                    player_entry["stats"]["fouls"] += 1
-
-    # Remove helper index before returning
+    # Materialize dict-shaped stats and remove the helper index before returning
+    for row, player_entry in enumerate(roster_entries):
+        base = row * width
+        player_entry["stats"] = dict(zip(STAT_KEYS, stats[base:base + width]))
     for team in teams.values():
         team.pop("_index", None)
 
     return teams
 
 
-def write_game_summary(game_id: int, game: dict, teams: Dict[int, dict]) -> None:
+def write_game_summary(
+    game_id: int,
+    game: dict,
+    teams: Dict[int, dict],
+    summary_path: Path,
+    build_key: dict,
+    pretty: bool = False,
+) -> None:
     summary = {
         "gameId": game_id,
         "finalScore": game.get("gamestate", {}).get("currentScore"),
         "periodsPlayed": game.get("gamestate", {}).get("period"),
         "teamStats": list(teams.values()),
+        "buildKey": build_key,
     }
 
-    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
-    summary_path = PROCESSED_DIR / f"game_{game_id}_summary.json"
-    summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    write_json(summary_path, summary)
 
-    pretty_raw_path = PROCESSED_DIR / f"game_{game_id}.pretty.json"
-    pretty_raw_path.write_text(json.dumps(game, indent=2), encoding="utf-8")
+    if pretty:
+        pretty_raw_path = summary_path.with_name(f"game_{game_id}.pretty.json")
+        write_json(pretty_raw_path, game)
 
 
 def aggregate_kog_players(
@@ -709,13 +842,14 @@ def compute_game_metrics(teams: Dict[int, dict], game_id: int | None = None, kog
     }
 
 
-def publish_kog_player_feed(totals: Dict[str, PlayerTotals], site_dir: Path) -> None:
-    site_dir.mkdir(parents=True, exist_ok=True)
-    rows = [player.as_row() for player in totals.values() if player.games_played]
-    rows.sort(key=lambda r: r["name"].lower())
+def publish_kog_player_feed(totals: Dict[str, PlayerTotals], site_dir: Path, season_key: str | None = None) -> None:
+    players = sorted((player for player in totals.values() if player.games_played), key=attrgetter("sort_name"))
+    rows = [player.as_row() for player in players]
+    if season_key:
+        apply_player_overrides(season_key, rows)
 
     feed_path = site_dir / "kog_players.json"
-    feed_path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    write_json(feed_path, rows)
 
 
 def update_player_records(
@@ -775,7 +909,6 @@ def publish_metadata(
     player_records: Dict[str, dict] | None,
     site_dir: Path,
 ) -> None:
-    site_dir.mkdir(parents=True, exist_ok=True)
     metadata = {
         "generatedAt": datetime.now(timezone.utc).isoformat(),
         "gamesProcessed": sorted(set(game_ids)),
@@ -783,38 +916,38 @@ def publish_metadata(
         "teamRecords": None,
         "playerRecords": player_records or None,
     }
-    metrics = list(game_metrics)
-    if metrics:
-        highest_score = max(metrics, key=lambda m: m["kogPoints"])
-        positive = [m for m in metrics if m["pointDiff"] > 0]
-        negative = [m for m in metrics if m["pointDiff"] < 0]
-
+    # Single pass; strict comparisons keep the earliest game on ties.
+    highest_score = biggest_win = toughest_loss = None
+    for m in game_metrics:
+        if highest_score is None or m["kogPoints"] > highest_score["kogPoints"]:
+            highest_score = m
+        diff = m["pointDiff"]
+        if diff > 0 and (biggest_win is None or diff > biggest_win["pointDiff"]):
+            biggest_win = m
+        elif diff < 0 and (toughest_loss is None or diff < toughest_loss["pointDiff"]):
+            toughest_loss = m
+
+    if highest_score is not None:
         metadata["teamRecords"] = {
             "highestScore": highest_score,
-            "biggestWin": max(positive, key=lambda m: m["pointDiff"]) if positive else None,
-            "toughestLoss": min(negative, key=lambda m: m["pointDiff"]) if negative else None,
+            "biggestWin": biggest_win,
+            "toughestLoss": toughest_loss,
         }
     meta_path = site_dir / "last_updated.json"
-    meta_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    write_json(meta_path, metadata)
 
 
 # ── Player overrides (for seasons with incomplete EMP data) ─────────────────
 
-def apply_player_overrides(season_key: str, site_dir: Path) -> None:
-    """Patch published kog_players.json with manual override totals if available."""
+def apply_player_overrides(season_key: str, rows: list[dict]) -> None:
+    """Patch KOG player rows in place with manual override totals if available."""
     override_path = ROOT / "data" / f"overrides_{season_key}.json"
     if not override_path.exists():
         return
 
-    overrides = json.loads(override_path.read_text(encoding="utf-8"))
+    overrides = load_json(override_path.read_bytes())
     override_by_name = {o["name"]: o for o in overrides}
 
-    feed_path = site_dir / "kog_players.json"
-    if not feed_path.exists():
-        return
-
-    rows = json.loads(feed_path.read_text(encoding="utf-8"))
-
     # Patch existing players
     seen_names = set()
     for row in rows:
@@ -847,14 +980,19 @@ def apply_player_overrides(season_key: str, site_dir: Path) -> None:
         })
 
     rows.sort(key=lambda r: r["name"].lower())
-    feed_path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
     print(f"  Applied {len(override_by_name)} player override(s)")
 
 
 # ── Per-season build ────────────────────────────────────────────────────────
 
-def build_season(season_cfg: dict) -> dict | None:
-    """Process one season and publish its data.  Returns season manifest entry or None."""
+def build_season(season_cfg: dict, pretty_raw: bool = False, incremental: bool = False) -> dict | None:
+    """Process one season and publish its data.  Returns season manifest entry or None.
+
+    With ``incremental`` set, a game whose summary was built from the same raw
+    feed bytes by the same version of this script is not re-parsed; its team
+    stats are read back from data/processed/ instead, and its play-by-play file
+    is kept when it still matches the schedule entry.
+    """
     key = season_cfg["key"]
     label = season_cfg["label"]
     start_year = season_cfg["startYear"]
@@ -868,6 +1006,9 @@ def build_season(season_cfg: dict) -> dict | None:
     if not schedule:
         return None
 
+    # Creates season_site_dir as well; the publish_* helpers assume it exists.
+    play_by_play_dir.mkdir(parents=True, exist_ok=True)
+
     allowed_ids = game_ids_for_season(season_cfg)
 
     kog_totals: Dict[str, PlayerTotals] = {}
@@ -876,14 +1017,23 @@ def build_season(season_cfg: dict) -> dict | None:
     player_records: dict[str, dict] = {}
     has_stats = False
 
-    for game_id, game in load_raw_games(allowed_ids or None):
+    for game_id, raw_file in raw_game_files(allowed_ids or None):
         # Only process games that are in this season's schedule or source list
         if allowed_ids and game_id not in allowed_ids:
             continue
         has_stats = True
 
-        teams = build_team_structures(game)
-        write_game_summary(game_id, game, teams)
+        game = None
+        raw_data = raw_file.read_bytes()
+        build_key = build_key_for(raw_data)
+        summary_path = PROCESSED_DIR / f"game_{game_id}_summary.json"
+        summary = load_existing_json(summary_path) if incremental and not pretty_raw else None
+        if isinstance(summary, dict) and summary.get("buildKey") == build_key:
+            teams = summary_teams(summary)
+        else:
+            game = load_json(raw_data)
+            teams = build_team_structures(game)
+            write_game_summary(game_id, game, teams, summary_path, build_key, pretty=pretty_raw)
 
         tipoff = None
         schedule_entry = schedule.get(game_id)
@@ -912,10 +1062,14 @@ def build_season(season_cfg: dict) -> dict | None:
                 opponent_team_id = team_id
                 break
         if schedule_entry:
-            publish_play_by_play(game_id, game, schedule_entry, opponent_team_id, play_by_play_dir, kog_team_id=kog_team_id)
-
-    publish_kog_player_feed(kog_totals, season_site_dir)
-    apply_player_overrides(key, season_site_dir)
+            play_by_play_path = play_by_play_dir / f"game_{game_id}.json"
+            if game is None:
+                if play_by_play_is_current(play_by_play_path, game_id, schedule_entry):
+                    continue
+                game = load_json(raw_data)
+            publish_play_by_play(game_id, game, schedule_entry, opponent_team_id, play_by_play_path, kog_team_id=kog_team_id)
+
+    publish_kog_player_feed(kog_totals, season_site_dir, season_key=key)
     publish_metadata(processed_games, kog_totals, game_metrics, player_records, season_site_dir)
     publish_schedule(schedule, season_site_dir)
 
@@ -936,7 +1090,7 @@ def build_season(season_cfg: dict) -> dict | None:
 
 # ── Main ────────────────────────────────────────────────────────────────────
 
-def main() -> None:
+def main(pretty_raw: bool = False, incremental: bool = False) -> None:
     seasons = discover_seasons()
     if not seasons:
         raise SystemExit("No seasons found. Add schedule_XX-YY.csv files to data/.")
@@ -944,21 +1098,40 @@ def main() -> None:
     links = load_links()
     manifest: list[dict] = []
 
+    # Output directories are created once here rather than per written file.
+    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+    SITE_DATA_DIR.mkdir(parents=True, exist_ok=True)
+
     for season_cfg in seasons:
         print(f"Building season {season_cfg['label']}…")
-        entry = build_season(season_cfg)
+        entry = build_season(season_cfg, pretty_raw=pretty_raw, incremental=incremental)
         if entry:
             manifest.append(entry)
             print(f"  → {entry['gamesPlayed']} played, stats={'yes' if entry['hasStats'] else 'no'}")
 
     # Write seasons manifest
-    SITE_DATA_DIR.mkdir(parents=True, exist_ok=True)
     manifest_path = SITE_DATA_DIR / "seasons.json"
-    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    write_json(manifest_path, manifest)
     print(f"Seasons manifest: {len(manifest)} season(s)")
 
     publish_links(links)
 
 
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build site-ready JSON from cached EMP feeds.")
+    parser.add_argument(
+        "--pretty-raw",
+        action="store_true",
+        help="also write an indented copy of each raw feed to data/processed/ for debugging",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="skip re-parsing games whose summary was built from the same raw feed by this script version",
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    main(pretty_raw=args.pretty_raw, incremental=args.incremental)
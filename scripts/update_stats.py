@@ -5,19 +5,27 @@ and rebuild the processed stats + site data for all seasons.
 """
 from __future__ import annotations
 
-import re
+import gzip
 import sys
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterable, List, Tuple
 
-from build_stats import main as build_stats_main
+from build_stats import emp_match_id, load_json, main as build_stats_main
 
 ROOT = Path(__file__).resolve().parents[1]
 RAW_DIR = ROOT / "data" / "raw"
 
-EMP_PATTERN = re.compile(r"/emp/(\d+)/")
+# Feeds are fetched concurrently; each one writes a distinct raw file.
+FETCH_WORKERS = 8
+
+# The feeds are verbose JSON, so ask for them compressed.
+REQUEST_HEADERS = {
+    "User-Agent": "kog-stats-fetcher/1.0",
+    "Accept-Encoding": "gzip",
+}
 
 
 def discover_source_files() -> list[Path]:
@@ -36,25 +44,38 @@ def read_sources(source_file: Path) -> Iterable[str]:
 
 
 def parse_match_id(url: str) -> int:
-    match = EMP_PATTERN.search(url)
-    if not match:
+    match_id = emp_match_id(url)
+    if match_id is None:
         raise ValueError(f"Could not extract match id from URL: {url}")
-    return int(match.group(1))
+    return match_id
 
 
 def fetch_feed(url: str, match_id: int) -> Tuple[int, bytes]:
-    req = urllib.request.Request(url, headers={"User-Agent": "kog-stats-fetcher/1.0"})
+    req = urllib.request.Request(url, headers=REQUEST_HEADERS)
     try:
         with urllib.request.urlopen(req, timeout=30) as response:
             data = response.read()
+            content_encoding = response.headers.get("Content-Encoding", "").lower()
     except urllib.error.HTTPError as exc:
         raise RuntimeError(f"HTTP error {exc.code} for {url}") from exc
     except urllib.error.URLError as exc:
         raise RuntimeError(f"Failed to fetch {url}: {exc.reason}") from exc
 
+    if content_encoding == "gzip":
+        try:
+            data = gzip.decompress(data)
+        except (OSError, EOFError) as exc:
+            raise RuntimeError(f"Corrupt gzip response for {url}: {exc}") from exc
+
     if not data:
         raise RuntimeError(f"No data returned for {url}")
 
+    # Parse once so a truncated or HTML error body never lands in data/raw.
+    try:
+        load_json(data)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid JSON returned for {url}: {exc}") from exc
+
     return match_id, data
 
 
@@ -65,6 +86,28 @@ def write_raw_feed(match_id: int, data: bytes) -> Path:
     return target
 
 
+def fetch_all(tasks: List[Tuple[str, int]], max_workers: int = FETCH_WORKERS) -> list[Path]:
+    """Fetch ``(url, match_id)`` tasks in parallel and write each raw feed."""
+    fetched: list[Path] = []
+    if not tasks:
+        return fetched
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fetch_feed, url, match_id) for url, match_id in tasks]
+        for future in as_completed(futures):
+            try:
+                match_id, payload = future.result()
+            except RuntimeError as exc:
+                print(f"[WARN] {exc}")
+                continue
+
+            path = write_raw_feed(match_id, payload)
+            fetched.append(path)
+            print(f"  Saved game {match_id} -> {path}")
+
+    return fetched
+
+
 def main() -> None:
     source_files = discover_source_files()
     if not source_files:
@@ -73,7 +116,8 @@ def main() -> None:
         build_stats_main()
         return
 
-    fetched: list[Path] = []
+    tasks: list[Tuple[str, int]] = []
+    queued: set[int] = set()
     for source_file in source_files:
         season_label = source_file.stem.replace("sources_", "")
         print(f"Processing sources for season {season_label}…")
@@ -89,24 +133,24 @@ def main() -> None:
             if cached_path.exists():
                 print(f"  Skipping game {match_id}; cached feed found")
                 continue
-
-            try:
-                match_id, payload = fetch_feed(url, match_id)
-            except RuntimeError as exc:
-                print(f"[WARN] {exc}")
+            if match_id in queued:
                 continue
 
-            path = write_raw_feed(match_id, payload)
-            fetched.append(path)
-            print(f"  Saved game {match_id} -> {path}")
+            queued.add(match_id)
+            tasks.append((url, match_id))
+
+    if tasks:
+        print(f"Fetching {len(tasks)} feed(s)…")
+    fetched = fetch_all(tasks)
 
     if fetched:
         print(f"Fetched {len(fetched)} new feed(s); regenerating outputs…")
     else:
         print("No new feeds fetched; using cached data.")
 
+    # Only new or changed feeds (or all of them after a build script change) get re-parsed.
     print("Rebuilding processed stats…")
-    build_stats_main()
+    build_stats_main(incremental=True)
     print("Done.")
 
 